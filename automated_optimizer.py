@@ -1,15 +1,11 @@
-import pygame
 import math
 import random
 import sys
 import time
 import json
+from collections import deque
 from datetime import datetime
-
-# Initialize Pygame with no display for headless mode
-import os
-os.environ['SDL_VIDEODRIVER'] = 'dummy'
-pygame.init()
+from itertools import islice, starmap
 
 # Constants
 SCREEN_WIDTH = 800
@@ -17,6 +13,7 @@ SCREEN_HEIGHT = 600
 FPS = 60
 INITIAL_HP = 10
 BASE_SIZE = 20
+NUDGE_POOL_SIZE = 1 << 14  # Power of two so the pool index can wrap with a mask
 
 # Colors
 BLACK = (0, 0, 0)
@@ -27,8 +24,22 @@ GRAY = (128, 128, 128)
 GREEN = (0, 255, 0)
 YELLOW = (255, 255, 0)
 
+# Issue counters tracked per frame, formatted only for the report
+ISSUE_LABELS = {
+    'sword_vel': "Sword excessive velocity change",
+    'shield_vel': "Shield excessive velocity change",
+    'sword_stuck': "Sword stuck",
+    'shield_stuck': "Shield stuck",
+}
+
 class GameObject:
     """Game object with iterative physics improvements"""
+    __slots__ = (
+        'x', 'y', 'vx', 'vy', 'hp', 'color', 'name', 'target_size', 'current_size',
+        'rotation', 'mass', 'iteration', 'max_velocity', 'max_velocity_sq', 'hp_gain',
+        'stuck_counter', 'last_position', 'position_history', 'velocity_history',
+    )
+    
     def __init__(self, x, y, color, name, iteration=1):
         self.x = x
         self.y = y
@@ -43,6 +54,10 @@ class GameObject:
         
         # Velocity caps improve with iterations
         self.max_velocity = 10.0 + (iteration * 2.0)
+        self.max_velocity_sq = self.max_velocity * self.max_velocity
+        
+        # Better HP gain with iterations
+        self.hp_gain = 1 + (iteration * 0.1)
         
         # Better initial velocity ranges
         vel_range = 3.0 + (iteration * 0.5)
@@ -59,8 +74,9 @@ class GameObject:
         # Tracking for analysis
         self.stuck_counter = 0
         self.last_position = (x, y)
-        self.position_history = []
-        self.velocity_history = []
+        # Fixed-size ring buffers: 1 second of history at 60 FPS
+        self.position_history = deque(maxlen=60)
+        self.velocity_history = deque(maxlen=60)
         
     def update(self, gravity_strength, growth_factor):
         """Update with iteration-based improvements"""
@@ -71,11 +87,12 @@ class GameObject:
         self.x += self.vx
         self.y += self.vy
         
-        # Cap velocity
-        velocity_magnitude = math.sqrt(self.vx**2 + self.vy**2)
-        if velocity_magnitude > self.max_velocity:
-            self.vx = (self.vx / velocity_magnitude) * self.max_velocity
-            self.vy = (self.vy / velocity_magnitude) * self.max_velocity
+        # Cap velocity (compare squared magnitudes, sqrt only when clamping)
+        velocity_sq = self.vx * self.vx + self.vy * self.vy
+        if velocity_sq > self.max_velocity_sq:
+            scale = self.max_velocity / math.sqrt(velocity_sq)
+            self.vx *= scale
+            self.vy *= scale
         
         # Update size based on HP with smooth interpolation
         self.target_size = BASE_SIZE + (self.hp - INITIAL_HP) * growth_factor
@@ -89,25 +106,19 @@ class GameObject:
         current_pos = (self.x, self.y)
         if len(self.position_history) > 0:
             last_pos = self.position_history[-1]
-            distance_moved = math.sqrt((current_pos[0] - last_pos[0])**2 + (current_pos[1] - last_pos[1])**2)
-            if distance_moved < 0.5:  # Very small movement
+            move_x = current_pos[0] - last_pos[0]
+            move_y = current_pos[1] - last_pos[1]
+            if move_x * move_x + move_y * move_y < 0.25:  # Moved less than 0.5 px
                 self.stuck_counter += 1
             else:
                 self.stuck_counter = 0
         
         self.position_history.append(current_pos)
         self.velocity_history.append((self.vx, self.vy))
-        
-        # Keep only recent history
-        if len(self.position_history) > 60:  # 1 second at 60 FPS
-            self.position_history.pop(0)
-            self.velocity_history.pop(0)
     
     def gain_hp(self):
         """Gain HP with progressive improvements"""
-        # Better HP gain with iterations
-        gain = 1 + (self.iteration * 0.1)
-        self.hp += gain
+        self.hp += self.hp_gain
         
     def lose_hp(self, amount):
         """Lose HP"""
@@ -119,6 +130,12 @@ class GameObject:
         """Check if object is stuck"""
         return self.stuck_counter > 30  # Stuck for half a second
 
+def average_speed(velocity_history, samples=30):
+    """Mean speed over the most recent velocity samples"""
+    count = min(samples, len(velocity_history))
+    recent = islice(velocity_history, len(velocity_history) - count, None)
+    return sum(starmap(math.hypot, recent)) / count
+
 class HexagonBoundary:
     """Rotating hexagon boundary with iteration improvements"""
     def __init__(self, center_x, center_y, radius, iteration=1):
@@ -131,96 +148,99 @@ class HexagonBoundary:
         # Rotation speed improves with iterations
         self.rotation_speed = 1.0 + (iteration * 0.2)
         
+        # Base vertex directions never change, only the rotation does
+        self._base_cos = tuple(math.cos(math.pi / 3 * i) for i in range(6))
+        self._base_sin = tuple(math.sin(math.pi / 3 * i) for i in range(6))
+        self._refresh_geometry()
+        
     def update(self):
         """Update hexagon rotation"""
         self.rotation += self.rotation_speed
+        self._refresh_geometry()
+        
+    def _refresh_geometry(self):
+        """Rebuild cached vertices and edges for the current rotation"""
+        self._vertices = self._compute_vertices()
+        vertices = self._vertices
+        self._edges = [(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1])]
+        # Vertices wind counter-clockwise, so the left-hand normal of each
+        # edge points inward; every side of a regular hexagon has length radius
+        inv_length = 1.0 / self.radius
+        self._edge_normals = [(-dy * inv_length, dx * inv_length) for dx, dy in self._edges]
+        
+    def _compute_vertices(self):
+        """Compute rotated hexagon vertices"""
+        cx, cy, r = self.center_x, self.center_y, self.radius
+        rot = math.radians(self.rotation)
+        rc = r * math.cos(rot)
+        rs = r * math.sin(rot)
+        # Angle-sum identities: two trig calls per update instead of twelve
+        return [(cx + bc * rc - bs * rs, cy + bs * rc + bc * rs)
+                for bc, bs in zip(self._base_cos, self._base_sin)]
         
     def get_vertices(self):
-        """Get rotated hexagon vertices"""
-        vertices = []
-        for i in range(6):
-            angle = math.radians(60 * i + self.rotation)
-            x = self.center_x + self.radius * math.cos(angle)
-            y = self.center_y + self.radius * math.sin(angle)
-            vertices.append((x, y))
-        return vertices
+        """Get rotated hexagon vertices (cached per update)"""
+        return self._vertices
     
-    def point_inside_rotated(self, x, y):
+    def point_inside(self, x, y):
         """Check if point is inside rotated hexagon"""
-        vertices = self.get_vertices()
-        n = len(vertices)
-        inside = False
-        
-        p1x, p1y = vertices[0]
-        for i in range(1, n + 1):
-            p2x, p2y = vertices[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
+        # Vertices wind counter-clockwise, so an interior point lies on the
+        # left of (or on) every edge of the convex hexagon
+        for (x1, y1), (edge_dx, edge_dy) in zip(self._vertices, self._edges):
+            if edge_dx * (y - y1) - edge_dy * (x - x1) < 0:
+                return False
+        return True
     
-    def get_collision_normal(self, x, y):
-        """Get collision normal for a point with iteration improvements"""
-        vertices = self.get_vertices()
-        closest_normal = (0, -1)  # Default upward normal
-        min_distance = float('inf')
+    def classify(self, x, y):
+        """Inside test and closest-edge normal in a single edge sweep
         
-        for i in range(len(vertices)):
-            x1, y1 = vertices[i]
-            x2, y2 = vertices[(i + 1) % len(vertices)]
+        Returns (inside, normal, distance) where normal points inward from
+        the closest edge and distance is the point's distance to that edge.
+        """
+        inside = True
+        closest_normal = (0, -1)  # Default upward normal
+        min_distance_sq = float('inf')
+        inv_length_sq = 1.0 / (self.radius * self.radius)
+        
+        for (x1, y1), (edge_dx, edge_dy), normal in zip(self._vertices, self._edges, self._edge_normals):
+            rel_x = x - x1
+            rel_y = y - y1
+            if edge_dx * rel_y - edge_dy * rel_x < 0:
+                inside = False
             
-            # Edge vector
-            edge_dx = x2 - x1
-            edge_dy = y2 - y1
-            edge_length = math.sqrt(edge_dx**2 + edge_dy**2)
+            # Project point onto edge and compare squared distances
+            t = max(0, min(1, (rel_x * edge_dx + rel_y * edge_dy) * inv_length_sq))
+            dist_x = rel_x - t * edge_dx
+            dist_y = rel_y - t * edge_dy
+            distance_sq = dist_x * dist_x + dist_y * dist_y
             
-            if edge_length > 0:
-                # Project point onto edge
-                t = max(0, min(1, ((x - x1) * edge_dx + (y - y1) * edge_dy) / (edge_length**2)))
-                xx = x1 + t * edge_dx
-                yy = y1 + t * edge_dy
-                
-                distance = math.sqrt((x - xx) ** 2 + (y - yy) ** 2)
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    # Normal calculation
-                    normal_x = -(edge_dy) / edge_length
-                    normal_y = edge_dx / edge_length
-                    
-                    # Ensure normal points inward
-                    center_dx = self.center_x - x
-                    center_dy = self.center_y - y
-                    if (normal_x * center_dx + normal_y * center_dy) < 0:
-                        normal_x = -normal_x
-                        normal_y = -normal_y
-                    
-                    closest_normal = (normal_x, normal_y)
+            if distance_sq < min_distance_sq:
+                min_distance_sq = distance_sq
+                closest_normal = normal
         
-        return closest_normal
+        min_distance = math.sqrt(min_distance_sq)
+        return inside, closest_normal, min_distance
+    
+    def get_collision_normal(self, x, y):
+        """Get collision normal for a point with iteration improvements"""
+        return self.classify(x, y)[1]
 
 class AutomatedOptimizer:
     """Automated headless optimizer for 10 iterations"""
     def __init__(self):
-        # Create dummy surface for headless mode
-        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
-        
         # Optimization parameters
         self.current_iteration = 1
         self.max_iterations = 10
-        self.iteration_duration = 5  # 5 seconds per iteration
+        self.iteration_duration = 5  # 5 simulated seconds per iteration
         
         # Results tracking
         self.results = []
         self.global_fixes = []
         
+        # Pre-drawn anti-stick nudges, consumed round-robin in the frame loop
+        self._nudge_pool = [random.uniform(-2, 2) for _ in range(NUDGE_POOL_SIZE)]
+        self._nudge_idx = 0
+        
         print("🤖 Starting Automated 10-Iteration Optimization")
         print("=" * 50)
         
@@ -235,13 +255,19 @@ class AutomatedOptimizer:
         self.separation_force = 0.5 + (iteration * 0.05)
         self.boundary_safety_margin = 5 + iteration
         
-        print(f"\n🔧 ITERATION {iteration}/{self.max_iterations}")
-        print(f"Damage Coefficient: {self.damage_coefficient:.3f}")
-        print(f"Growth Factor: {self.growth_factor:.3f}")
-        print(f"Gravity: {self.gravity_strength:.3f}")
-        print(f"Energy Loss: {self.energy_loss_factor:.3f}")
-        print(f"Restitution: {self.restitution:.3f}")
-        print(f"Safety Margin: {self.boundary_safety_margin}")
+        # Derived per-iteration constants used every frame
+        self._reflect_factor = 2 * self.restitution
+        self._push_factor = 0.9
+        
+        print(
+            f"\n🔧 ITERATION {iteration}/{self.max_iterations}\n"
+            f"Damage Coefficient: {self.damage_coefficient:.3f}\n"
+            f"Growth Factor: {self.growth_factor:.3f}\n"
+            f"Gravity: {self.gravity_strength:.3f}\n"
+            f"Energy Loss: {self.energy_loss_factor:.3f}\n"
+            f"Restitution: {self.restitution:.3f}\n"
+            f"Safety Margin: {self.boundary_safety_margin}"
+        )
         
     def create_objects(self, iteration):
         """Create game objects for iteration"""
@@ -261,51 +287,68 @@ class AutomatedOptimizer:
             "Shield",
             iteration
         )
-        
-    def check_boundary_collision(self, obj):
-        """Check and handle boundary collisions"""
-        if not self.hexagon.point_inside_rotated(obj.x, obj.y):
-            obj.gain_hp()
+        self.objects = (self.sword, self.shield)
+        self._inv_total_mass = 1.0 / (self.sword.mass + self.shield.mass)
+        
+    def _next_nudge(self):
+        """Next random nudge in [-2, 2] from the pre-drawn pool"""
+        value = self._nudge_pool[self._nudge_idx]
+        self._nudge_idx = (self._nudge_idx + 1) & (NUDGE_POOL_SIZE - 1)
+        return value
+    
+    def check_boundary_collisions(self, objects):
+        """Check and handle boundary collisions for a batch of objects"""
+        hexagon = self.hexagon
+        classify = hexagon.classify
+        center_x = hexagon.center_x
+        center_y = hexagon.center_y
+        reflect_factor = self._reflect_factor
+        energy_loss_factor = self.energy_loss_factor
+        push_factor = self._push_factor
+        anti_stick = self.current_iteration > 3
+        
+        for obj in objects:
+            inside, normal, _ = classify(obj.x, obj.y)
+            if inside:
+                continue
             
-            # Get collision normal
-            normal = self.hexagon.get_collision_normal(obj.x, obj.y)
+            obj.gain_hp()
             nx, ny = normal
             
             # Reflect velocity
             dot_product = obj.vx * nx + obj.vy * ny
-            obj.vx -= 2 * dot_product * nx * self.restitution
-            obj.vy -= 2 * dot_product * ny * self.restitution
+            obj.vx -= dot_product * nx * reflect_factor
+            obj.vy -= dot_product * ny * reflect_factor
             
             # Apply energy loss
-            obj.vx *= self.energy_loss_factor
-            obj.vy *= self.energy_loss_factor
+            obj.vx *= energy_loss_factor
+            obj.vy *= energy_loss_factor
             
             # Push object inside with safety margin
-            obj.x = self.hexagon.center_x + (obj.x - self.hexagon.center_x) * 0.9
-            obj.y = self.hexagon.center_y + (obj.y - self.hexagon.center_y) * 0.9
+            obj.x = center_x + (obj.x - center_x) * push_factor
+            obj.y = center_y + (obj.y - center_y) * push_factor
             
             # Anti-sticking measures for higher iterations
-            if self.current_iteration > 3:
-                if obj.is_stuck():
-                    # Apply random nudge
-                    obj.vx += random.uniform(-2, 2)
-                    obj.vy += random.uniform(-2, 2)
-                    obj.stuck_counter = 0
+            if anti_stick and obj.is_stuck():
+                # Apply random nudge
+                obj.vx += self._next_nudge()
+                obj.vy += self._next_nudge()
+                obj.stuck_counter = 0
                     
     def check_object_collision(self):
         """Check collision between objects"""
         dx = self.shield.x - self.sword.x
         dy = self.shield.y - self.sword.y
-        distance = math.sqrt(dx**2 + dy**2)
+        distance_sq = dx * dx + dy * dy
         min_distance = (self.sword.current_size + self.shield.current_size) / 2
         
-        if distance < min_distance and distance > 0:
-            # Mass-based collision resolution
-            total_mass = self.sword.mass + self.shield.mass
+        if distance_sq < min_distance * min_distance and distance_sq > 0:
+            distance = math.sqrt(distance_sq)
+            inv_distance = 1.0 / distance
             
             # Collision response
-            nx = dx / distance
-            ny = dy / distance
+            nx = dx * inv_distance
+            ny = dy * inv_distance
             
             # Relative velocity
             dvx = self.shield.vx - self.sword.vx
@@ -318,7 +361,7 @@ class AutomatedOptimizer:
                 return  # Objects separating
             
             # Collision impulse
-            impulse = 2 * dvn / total_mass
+            impulse = 2 * dvn * self._inv_total_mass
             
             # Update velocities
             self.sword.vx += impulse * self.shield.mass * nx
@@ -338,70 +381,85 @@ class AutomatedOptimizer:
             self.shield.x += overlap * 0.5 * nx
             self.shield.y += overlap * 0.5 * ny
     
+    def step(self):
+        """Advance the simulation by one frame
+        
+        Returns the squared change of each object's velocity during
+        collision resolution, which the caller uses to flag unstable frames.
+        """
+        sword = self.sword
+        shield = self.shield
+        
+        # Update hexagon
+        self.hexagon.update()
+        
+        # Update objects
+        gravity_strength = self.gravity_strength
+        growth_factor = self.growth_factor
+        for obj in self.objects:
+            obj.update(gravity_strength, growth_factor)
+        
+        # Store pre-collision velocities
+        sword_vx, sword_vy = sword.vx, sword.vy
+        shield_vx, shield_vy = shield.vx, shield.vy
+        
+        # Check collisions
+        self.check_boundary_collisions(self.objects)
+        self.check_object_collision()
+        
+        # Squared velocity changes (large values indicate problems)
+        sword_dvx = sword.vx - sword_vx
+        sword_dvy = sword.vy - sword_vy
+        shield_dvx = shield.vx - shield_vx
+        shield_dvy = shield.vy - shield_vy
+        return (sword_dvx * sword_dvx + sword_dvy * sword_dvy,
+                shield_dvx * shield_dvx + shield_dvy * shield_dvy)
+    
     def run_iteration(self, iteration):
         """Run a single iteration and collect data"""
         self.init_iteration_parameters(iteration)
         self.create_objects(iteration)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         frames = 0
         collisions = 0
-        issues_detected = []
+        issue_counts = dict.fromkeys(ISSUE_LABELS, 0)
         
-        # Run simulation
-        while time.time() - start_time < self.iteration_duration:
-            # Update hexagon
-            self.hexagon.update()
-            
-            # Update objects
-            self.sword.update(self.gravity_strength, self.growth_factor)
-            self.shield.update(self.gravity_strength, self.growth_factor)
-            
-            # Store pre-collision velocities
-            sword_vel_before = (self.sword.vx, self.sword.vy)
-            shield_vel_before = (self.shield.vx, self.shield.vy)
-            
-            # Check collisions
-            self.check_boundary_collision(self.sword)
-            self.check_boundary_collision(self.shield)
-            self.check_object_collision()
+        # Run a fixed frame budget as fast as possible (headless, no throttle)
+        for _ in range(self.iteration_duration * FPS):
+            sword_vel_change_sq, shield_vel_change_sq = self.step()
             
-            # Detect excessive velocity changes (indicates problems)
-            sword_vel_after = (self.sword.vx, self.sword.vy)
-            shield_vel_after = (self.shield.vx, self.shield.vy)
-            
-            sword_vel_change = math.sqrt((sword_vel_after[0] - sword_vel_before[0])**2 + 
-                                       (sword_vel_after[1] - sword_vel_before[1])**2)
-            shield_vel_change = math.sqrt((shield_vel_after[0] - shield_vel_before[0])**2 + 
-                                        (shield_vel_after[1] - shield_vel_before[1])**2)
-            
-            if sword_vel_change > 20:
-                issues_detected.append(f"Sword excessive velocity change: {sword_vel_change:.2f}")
-            if shield_vel_change > 20:
-                issues_detected.append(f"Shield excessive velocity change: {shield_vel_change:.2f}")
+            # Detect excessive velocity changes (> 20 px/frame indicates problems)
+            if sword_vel_change_sq > 400:
+                issue_counts['sword_vel'] += 1
+            if shield_vel_change_sq > 400:
+                issue_counts['shield_vel'] += 1
             
             # Check for stuck objects
             if self.sword.is_stuck():
-                issues_detected.append("Sword stuck")
+                issue_counts['sword_stuck'] += 1
             if self.shield.is_stuck():
-                issues_detected.append("Shield stuck")
+                issue_counts['shield_stuck'] += 1
             
             # Reset if objects die
             if self.sword.hp <= 0 or self.shield.hp <= 0:
                 self.create_objects(iteration)
                 
             frames += 1
-            self.clock.tick(FPS)
         
         # Calculate metrics
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         fps = frames / duration if duration > 0 else 0
         
-        sword_avg_vel = sum(math.sqrt(vx**2 + vy**2) for vx, vy in self.sword.velocity_history[-30:]) / min(30, len(self.sword.velocity_history))
-        shield_avg_vel = sum(math.sqrt(vx**2 + vy**2) for vx, vy in self.shield.velocity_history[-30:]) / min(30, len(self.shield.velocity_history))
+        sword_avg_vel = average_speed(self.sword.velocity_history)
+        shield_avg_vel = average_speed(self.shield.velocity_history)
+        
+        # Materialize issue descriptions only once, after the frame loop
+        total_issues = sum(issue_counts.values())
+        issues_list = [f"{ISSUE_LABELS[key]} ({count} frames)" for key, count in issue_counts.items() if count]
         
         # Calculate stability (lower is better)
-        stability_score = 1.0 - (len(issues_detected) / max(1, frames / 60))  # Issues per second
+        stability_score = 1.0 - (total_issues / max(1, frames / 60))  # Issues per second
         
         result = {
             'iteration': iteration,
@@ -411,14 +469,14 @@ class AutomatedOptimizer:
             'shield_avg_velocity': shield_avg_vel,
             'sword_final_hp': self.sword.hp,
             'shield_final_hp': self.shield.hp,
-            'issues_detected': len(issues_detected),
+            'issues_detected': total_issues,
             'stability_score': max(0, stability_score),
-            'issues_list': list(set(issues_detected[:10]))  # Unique issues, max 10
+            'issues_list': issues_list
         }
         
-        print(f"✅ Results: FPS={fps:.1f}, Stability={stability_score:.3f}, Issues={len(issues_detected)}")
-        if issues_detected:
-            print(f"🔍 Issues: {', '.join(list(set(issues_detected))[:3])}")
+        print(f"✅ Results: FPS={fps:.1f}, Stability={stability_score:.3f}, Issues={total_issues}")
+        if issues_list:
+            print(f"🔍 Issues: {', '.join(issues_list[:3])}")
         
         return result
     
@@ -463,26 +521,28 @@ class AutomatedOptimizer:
             }
         }
         
-        # Save report
+        # Save report: serialize once and write it in a single call
         with open('10_iteration_optimization_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
-        
-        print("\n" + "="*60)
-        print("🎯 FINAL OPTIMIZATION REPORT")
-        print("="*60)
-        print(f"Best Iteration: #{report['summary']['best_iteration']['iteration']} (Stability: {report['summary']['best_iteration']['stability_score']:.3f})")
-        print(f"Worst Iteration: #{report['summary']['worst_iteration']['iteration']} (Stability: {report['summary']['worst_iteration']['stability_score']:.3f})")
-        print(f"Average FPS: {report['summary']['avg_fps']:.1f}")
-        print(f"Average Stability: {report['summary']['avg_stability']:.3f}")
-        print(f"Total Issues Found: {report['summary']['total_issues']}")
-        print(f"Improvement Trend: {report['summary']['improvement_trend']:+.3f}")
-        print(f"Total Fixes Applied: {len(self.global_fixes)}")
-        print("\n📊 Report saved to '10_iteration_optimization_report.json'")
+            f.write(json.dumps(report, indent=2))
+        
+        summary = report['summary']
+        print(
+            "\n" + "="*60 + "\n"
+            "🎯 FINAL OPTIMIZATION REPORT\n"
+            + "="*60 + "\n"
+            f"Best Iteration: #{summary['best_iteration']['iteration']} (Stability: {summary['best_iteration']['stability_score']:.3f})\n"
+            f"Worst Iteration: #{summary['worst_iteration']['iteration']} (Stability: {summary['worst_iteration']['stability_score']:.3f})\n"
+            f"Average FPS: {summary['avg_fps']:.1f}\n"
+            f"Average Stability: {summary['avg_stability']:.3f}\n"
+            f"Total Issues Found: {summary['total_issues']}\n"
+            f"Improvement Trend: {summary['improvement_trend']:+.3f}\n"
+            f"Total Fixes Applied: {len(self.global_fixes)}\n"
+            "\n📊 Report saved to '10_iteration_optimization_report.json'"
+        )
         
         return report
 
 if __name__ == "__main__":
     optimizer = AutomatedOptimizer()
     optimizer.optimize()
-    pygame.quit()
     print("\n🏁 Optimization complete!")
@@ -1,4 +1,5 @@
 import pygame
+import math
 import sys
 
 # Initialize Pygame
@@ -12,12 +13,8 @@ icon.fill((0, 0, 0))  # Black background
 # Draw a simple hexagon
 center = (icon_size // 2, icon_size // 2)
 radius = 25
-points = []
-for i in range(6):
-    angle = i * 60
-    x = center[0] + radius * pygame.math.Vector2(1, 0).rotate(angle).x
-    y = center[1] + radius * pygame.math.Vector2(1, 0).rotate(angle).y
-    points.append((x, y))
+angles = [math.radians(i * 60) for i in range(6)]
+points = [(center[0] + radius * math.cos(a), center[1] + radius * math.sin(a)) for a in angles]
 
 pygame.draw.polygon(icon, (255, 255, 255), points, 3)
 
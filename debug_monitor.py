@@ -1,159 +1,342 @@
 import pygame
 import math
-import time
 import json
+from array import array
 from collections import deque
+from itertools import chain, islice
+
+# Layout of the flat records kept in data_points['boundary_hits']
+BOUNDARY_HIT_FIELDS = ('time', 'object', 'x', 'y')
+
+class FloatRing:
+    """Fixed-capacity ring of floats backed by a preallocated array('d')
+    
+    Drop-in for deque(maxlen=n) on the numeric per-frame channels: appends
+    overwrite the oldest slot without allocating, and iteration yields the
+    stored values oldest first.
+    """
+    __slots__ = ('_buf', '_index', '_count', 'maxlen')
+    
+    def __init__(self, maxlen):
+        self._buf = array('d', bytes(8 * maxlen))
+        self._index = 0
+        self._count = 0
+        self.maxlen = maxlen
+    
+    def append(self, value):
+        index = self._index
+        self._buf[index] = value
+        index += 1
+        self._index = 0 if index == self.maxlen else index
+        if self._count < self.maxlen:
+            self._count += 1
+    
+    def __len__(self):
+        return self._count
+    
+    def __iter__(self):
+        if self._count < self.maxlen:
+            return iter(self._buf[:self._count])
+        return chain(self._buf[self._index:], self._buf[:self._index])
+
+class CollisionEvent:
+    """Lightweight record of a sword/shield collision"""
+    __slots__ = ('time', 'sword_hp_before', 'shield_hp_before', 'sword_hp_after',
+                 'shield_hp_after', 'impulse_sq', 'damage_coefficient')
+    
+    def __init__(self, time, sword_hp_before, shield_hp_before, sword_hp_after,
+                 shield_hp_after, impulse_sq, damage_coefficient):
+        self.time = time
+        self.sword_hp_before = sword_hp_before
+        self.shield_hp_before = shield_hp_before
+        self.sword_hp_after = sword_hp_after
+        self.shield_hp_after = shield_hp_after
+        self.impulse_sq = impulse_sq
+        self.damage_coefficient = damage_coefficient
+
+def _mean_var(values):
+    """Mean and population variance of a sequence of floats (0, 0 if empty)"""
+    count = len(values)
+    if not count:
+        return 0, 0
+    mean = sum(values) / count
+    return mean, sum((v - mean) ** 2 for v in values) / count
+
+def _push_window_max(queue, value, index, window):
+    """Push onto a monotonic max-queue covering the last `window` indices
+    
+    The queue holds (value, index) pairs with decreasing values, so
+    queue[0][0] is always the maximum of the window.
+    """
+    while queue and queue[-1][0] <= value:
+        queue.pop()
+    queue.append((value, index))
+    while queue[0][1] <= index - window:
+        queue.popleft()
 
 class GameMonitor:
     """Real-time game monitoring and analysis system"""
+    __slots__ = (
+        'data_points', 'start_ms', 'last_frame_ms', 'frame_count', 'collision_count',
+        'boundary_hit_count', '_append_time', '_append_sword_hp', '_append_shield_hp',
+        '_append_sword_velocity', '_append_shield_velocity', '_append_sword_position',
+        '_append_shield_position', '_velocity_history', '_analysis_cache',
+        '_latest_analysis', '_latest_analysis_ms', '_ema_dt', '_sword_vel_maxq',
+        '_shield_vel_maxq', '_sword_recent_maxq', '_shield_recent_maxq', '_anomalies_cache',
+        '_anomaly_text',
+    )
     
     def __init__(self):
         self.data_points = {
-            'time': deque(maxlen=1000),
-            'sword_hp': deque(maxlen=1000),
-            'shield_hp': deque(maxlen=1000),
-            'sword_velocity': deque(maxlen=1000),
-            'shield_velocity': deque(maxlen=1000),
+            'time': FloatRing(1000),
+            'sword_hp': FloatRing(1000),
+            'shield_hp': FloatRing(1000),
+            'sword_velocity': FloatRing(1000),
+            'shield_velocity': FloatRing(1000),
             'sword_position': deque(maxlen=1000),
             'shield_position': deque(maxlen=1000),
             'collisions': deque(maxlen=100),
             'boundary_hits': deque(maxlen=100),
             'physics_events': deque(maxlen=200)
         }
-        self.start_time = time.time()
+        # Bound append methods for the per-frame channels
+        data_points = self.data_points
+        self._append_time = data_points['time'].append
+        self._append_sword_hp = data_points['sword_hp'].append
+        self._append_shield_hp = data_points['shield_hp'].append
+        self._append_sword_velocity = data_points['sword_velocity'].append
+        self._append_shield_velocity = data_points['shield_velocity'].append
+        self._append_sword_position = data_points['sword_position'].append
+        self._append_shield_position = data_points['shield_position'].append
+        self._velocity_history = data_points['sword_velocity'].maxlen
+        
+        # Timestamps are pygame ticks (integer milliseconds)
+        self.start_ms = pygame.time.get_ticks()
+        self.last_frame_ms = self.start_ms
         self.frame_count = 0
         self.collision_count = 0
         self.boundary_hit_count = 0
         
-    def record_frame(self, game):
-        """Record current frame data"""
-        current_time = time.time() - self.start_time
+        # Per-frame analysis cache, throttled snapshot for the render path,
+        # and smoothed frame time for FPS
+        self._analysis_cache = (None, -1)
+        self._latest_analysis = None
+        self._latest_analysis_ms = 0
+        self._ema_dt = 0.0
+        
+        # Monotonic (value, frame) queues: sliding-window velocity maxima
+        # over the full history and over the last 10 frames
+        self._sword_vel_maxq = deque()
+        self._shield_vel_maxq = deque()
+        self._sword_recent_maxq = deque()
+        self._shield_recent_maxq = deque()
+        self._anomalies_cache = (None, None)
+        self._anomaly_text = {}
+        
+    def record_frame(self, game, now_ms=None):
+        """Record current frame data
+        
+        now_ms is the frame's pygame tick count; callers that already read
+        the clock this frame should pass it in to avoid another query.
+        """
+        if now_ms is None:
+            now_ms = pygame.time.get_ticks()
+        current_time = (now_ms - self.start_ms) / 1000.0
+        
+        # Exponential moving average of the frame delta (seconds)
+        if self.frame_count:
+            dt = (now_ms - self.last_frame_ms) / 1000.0
+            self._ema_dt = dt if self._ema_dt == 0 else 0.9 * self._ema_dt + 0.1 * dt
+        self.last_frame_ms = now_ms
         self.frame_count += 1
         
+        sword = game.sword
+        shield = game.shield
+        sword_vx, sword_vy = sword.vx, sword.vy
+        shield_vx, shield_vy = shield.vx, shield.vy
+        
         # Record basic data
-        self.data_points['time'].append(current_time)
-        self.data_points['sword_hp'].append(game.sword.hp)
-        self.data_points['shield_hp'].append(game.shield.hp)
+        self._append_time(current_time)
+        self._append_sword_hp(sword.hp)
+        self._append_shield_hp(shield.hp)
         
         # Calculate velocities
-        sword_vel = math.sqrt(game.sword.vx**2 + game.sword.vy**2)
-        shield_vel = math.sqrt(game.shield.vx**2 + game.shield.vy**2)
-        self.data_points['sword_velocity'].append(sword_vel)
-        self.data_points['shield_velocity'].append(shield_vel)
+        sword_vel = math.hypot(sword_vx, sword_vy)
+        shield_vel = math.hypot(shield_vx, shield_vy)
+        self._append_sword_velocity(sword_vel)
+        self._append_shield_velocity(shield_vel)
+        
+        # Maintain window maxima so anomaly checks are O(1)
+        frame = self.frame_count
+        history = self._velocity_history
+        _push_window_max(self._sword_vel_maxq, sword_vel, frame, history)
+        _push_window_max(self._shield_vel_maxq, shield_vel, frame, history)
+        _push_window_max(self._sword_recent_maxq, sword_vel, frame, 10)
+        _push_window_max(self._shield_recent_maxq, shield_vel, frame, 10)
         
         # Record positions
-        self.data_points['sword_position'].append((game.sword.x, game.sword.y))
-        self.data_points['shield_position'].append((game.shield.x, game.shield.y))
+        self._append_sword_position((sword.x, sword.y))
+        self._append_shield_position((shield.x, shield.y))
         
+    def elapsed_seconds(self):
+        """Session time up to the most recently recorded frame"""
+        return (self.last_frame_ms - self.start_ms) / 1000.0
+    
     def record_collision(self, game, collision_type, details):
         """Record collision events"""
         if collision_type == "object":
             self.collision_count += 1
-            event = {
-                'time': time.time() - self.start_time,
-                'type': 'object_collision',
-                'sword_hp_before': details.get('sword_hp_before', 0),
-                'shield_hp_before': details.get('shield_hp_before', 0),
-                'sword_hp_after': game.sword.hp,
-                'shield_hp_after': game.shield.hp,
-                'impulse_magnitude': details.get('impulse', 0),
-                'damage_coefficient': game.damage_coefficient
-            }
-            self.data_points['collisions'].append(event)
+            self.data_points['collisions'].append(CollisionEvent(
+                self.elapsed_seconds(),
+                details.get('sword_hp_before', 0),
+                details.get('shield_hp_before', 0),
+                game.sword.hp,
+                game.shield.hp,
+                details.get('impulse_sq', 0),
+                game.damage_coefficient
+            ))
             
         elif collision_type == "boundary":
             self.boundary_hit_count += 1
-            event = {
-                'time': time.time() - self.start_time,
-                'object': details.get('object', 'unknown'),
-                'hp_gain': 1,
-                'position': (details.get('x', 0), details.get('y', 0))
-            }
-            self.data_points['boundary_hits'].append(event)
+            # Flat record, see BOUNDARY_HIT_FIELDS for the layout
+            self.data_points['boundary_hits'].append((
+                self.elapsed_seconds(),
+                details.get('object', 'unknown'),
+                details.get('x', 0),
+                details.get('y', 0)
+            ))
     
     def analyze_stability(self):
-        """Analyze game stability and physics"""
+        """Analyze game stability and physics (cached until the next frame)"""
+        cached, cached_frame = self._analysis_cache
+        if cached_frame == self.frame_count:
+            return cached
+        
+        sword_mean, sword_variance = _mean_var(self.data_points['sword_velocity'])
+        shield_mean, shield_variance = _mean_var(self.data_points['shield_velocity'])
+        elapsed = self.elapsed_seconds()
+        if self._ema_dt > 0:
+            fps = 1.0 / self._ema_dt
+        else:
+            fps = self.frame_count / elapsed if elapsed > 0 else 0
         analysis = {
-            'fps': self.frame_count / (time.time() - self.start_time) if time.time() - self.start_time > 0 else 0,
-            'collision_rate': self.collision_count / (time.time() - self.start_time) if time.time() - self.start_time > 0 else 0,
-            'boundary_hit_rate': self.boundary_hit_count / (time.time() - self.start_time) if time.time() - self.start_time > 0 else 0,
-            'average_sword_velocity': sum(self.data_points['sword_velocity']) / len(self.data_points['sword_velocity']) if self.data_points['sword_velocity'] else 0,
-            'average_shield_velocity': sum(self.data_points['shield_velocity']) / len(self.data_points['shield_velocity']) if self.data_points['shield_velocity'] else 0,
-            'velocity_stability': self.calculate_velocity_stability()
+            'fps': fps,
+            'collision_rate': self.collision_count / elapsed if elapsed > 0 else 0,
+            'boundary_hit_rate': self.boundary_hit_count / elapsed if elapsed > 0 else 0,
+            'average_sword_velocity': sword_mean,
+            'average_shield_velocity': shield_mean,
+            'velocity_stability': self.calculate_velocity_stability(sword_variance, shield_variance)
         }
+        self._analysis_cache = (analysis, self.frame_count)
         return analysis
     
-    def calculate_velocity_stability(self):
-        """Calculate how stable the velocities are (lower variance = more stable)"""
-        if len(self.data_points['sword_velocity']) < 10:
-            return 0
+    def latest_analysis(self, max_age_ms=250):
+        """Analysis snapshot refreshed at most every max_age_ms of game time
         
-        # Calculate variance manually
-        sword_velocities = list(self.data_points['sword_velocity'])
-        shield_velocities = list(self.data_points['shield_velocity'])
+        Meant for per-frame readers such as the debug overlay, which do not
+        need a full re-analysis on every frame.
+        """
+        if self._latest_analysis is None or self.last_frame_ms - self._latest_analysis_ms >= max_age_ms:
+            self._latest_analysis = self.analyze_stability()
+            self._latest_analysis_ms = self.last_frame_ms
+        return self._latest_analysis
+    
+    def calculate_velocity_stability(self, sword_variance=None, shield_variance=None):
+        """Calculate how stable the velocities are (lower variance = more stable)
         
-        sword_mean = sum(sword_velocities) / len(sword_velocities)
-        shield_mean = sum(shield_velocities) / len(shield_velocities)
+        Variances already computed by the caller can be passed in to avoid
+        another pass over the velocity history.
+        """
+        if len(self.data_points['sword_velocity']) < 10:
+            return 0
         
-        sword_variance = sum((v - sword_mean) ** 2 for v in sword_velocities) / len(sword_velocities)
-        shield_variance = sum((v - shield_mean) ** 2 for v in shield_velocities) / len(shield_velocities)
+        if sword_variance is None:
+            sword_variance = _mean_var(self.data_points['sword_velocity'])[1]
+        if shield_variance is None:
+            shield_variance = _mean_var(self.data_points['shield_velocity'])[1]
         
         return 1.0 / (1.0 + sword_variance + shield_variance)  # Higher = more stable
     
+    def _anomaly_message(self, template, value):
+        """Format an anomaly message, reusing the string for repeated values"""
+        key = (template, value)
+        text = self._anomaly_text.get(key)
+        if text is None:
+            if len(self._anomaly_text) >= 256:
+                self._anomaly_text.clear()
+            text = self._anomaly_text[key] = template.format(value)
+        return text
+    
     def detect_anomalies(self):
         """Detect potential physics problems"""
+        # Nothing new recorded since the last scan: reuse its result
+        state = (self.frame_count, self.collision_count)
+        if self._anomalies_cache[1] == state:
+            return list(self._anomalies_cache[0])
+        
         anomalies = []
         
-        # Check for extremely high velocities
-        if self.data_points['sword_velocity']:
-            max_sword_vel = max(self.data_points['sword_velocity'])
+        # Check for extremely high velocities (window maxima kept by record_frame)
+        if self._sword_vel_maxq:
+            max_sword_vel = self._sword_vel_maxq[0][0]
             if max_sword_vel > 20:
-                anomalies.append(f"High sword velocity detected: {max_sword_vel:.2f}")
+                anomalies.append(self._anomaly_message("High sword velocity detected: {:.2f}", max_sword_vel))
         
-        if self.data_points['shield_velocity']:
-            max_shield_vel = max(self.data_points['shield_velocity'])
+        if self._shield_vel_maxq:
+            max_shield_vel = self._shield_vel_maxq[0][0]
             if max_shield_vel > 20:
-                anomalies.append(f"High shield velocity detected: {max_shield_vel:.2f}")
-        
-        # Check for stuck objects (very low velocity for extended time)
-        recent_sword_vel = list(self.data_points['sword_velocity'])[-10:] if len(self.data_points['sword_velocity']) >= 10 else []
-        recent_shield_vel = list(self.data_points['shield_velocity'])[-10:] if len(self.data_points['shield_velocity']) >= 10 else []
+                anomalies.append(self._anomaly_message("High shield velocity detected: {:.2f}", max_shield_vel))
         
-        if recent_sword_vel and all(v < 0.1 for v in recent_sword_vel):
+        # Check for stuck objects (very low velocity for the last 10 frames)
+        if len(self.data_points['sword_velocity']) >= 10 and self._sword_recent_maxq[0][0] < 0.1:
             anomalies.append("Sword appears to be stuck (very low velocity)")
         
-        if recent_shield_vel and all(v < 0.1 for v in recent_shield_vel):
+        if len(self.data_points['shield_velocity']) >= 10 and self._shield_recent_maxq[0][0] < 0.1:
             anomalies.append("Shield appears to be stuck (very low velocity)")
         
         # Check for rapid HP changes
-        if len(self.data_points['collisions']) >= 2:
-            recent_collisions = list(self.data_points['collisions'])[-5:]
-            for collision in recent_collisions:
-                damage_dealt = collision['sword_hp_before'] - collision['sword_hp_after']
+        collisions = self.data_points['collisions']
+        if len(collisions) >= 2:
+            for collision in islice(collisions, max(0, len(collisions) - 5), None):
+                damage_dealt = collision.sword_hp_before - collision.sword_hp_after
                 if damage_dealt > 20:
-                    anomalies.append(f"Excessive damage detected: {damage_dealt}")
+                    anomalies.append(self._anomaly_message("Excessive damage detected: {}", damage_dealt))
         
-        return anomalies
+        self._anomalies_cache = (anomalies, state)
+        return list(anomalies)
     
-    def save_report(self, filename="game_analysis.json"):
-        """Save analysis report to file"""
-        analysis = self.analyze_stability()
-        anomalies = self.detect_anomalies()
-        
-        report = {
-            'analysis': analysis,
-            'anomalies': anomalies,
+    def build_report(self):
+        """Collect the current analysis, anomalies and counters"""
+        return {
+            'analysis': self.analyze_stability(),
+            'anomalies': self.detect_anomalies(),
             'total_frames': self.frame_count,
             'total_collisions': self.collision_count,
             'total_boundary_hits': self.boundary_hit_count,
-            'session_duration': time.time() - self.start_time
+            'session_duration': self.elapsed_seconds()
         }
+    
+    def save_report(self, filename="game_analysis.json"):
+        """Save analysis report to file"""
+        report = self.build_report()
         
+        # Serialize once and write in a single call
         with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+            f.write(json.dumps(report, indent=2))
         
         print(f"Analysis report saved to {filename}")
         return report
+    
+    def save_snapshot(self, filename="game_analysis.jsonl"):
+        """Append the current report as one compact JSON line
+        
+        Each call writes only the current snapshot, so periodic dumps stay
+        cheap however long the session runs.
+        """
+        report = self.build_report()
+        with open(filename, 'a') as f:
+            f.write(json.dumps(report, separators=(',', ':')) + "\n")
+        return report
 
 def create_enhanced_game_with_monitoring():
     """Create a modified version of the game with integrated monitoring"""
@@ -170,19 +353,33 @@ def create_enhanced_game_with_monitoring():
             self.auto_adjust = True
             self.last_optimization_time = 0
             
+            # Debug overlay font and rendered-line cache (oldest evicted first)
+            self._debug_font = pygame.font.Font(None, 18)
+            self._text_cache = {}
+            
+            # Event type -> handler; handlers return False to stop the game
+            self._event_handlers = {
+                pygame.MOUSEBUTTONDOWN: self._on_mouse_down,
+                pygame.MOUSEBUTTONUP: self._on_mouse_up,
+                pygame.MOUSEMOTION: self._on_mouse_motion,
+            }
+            
         def update(self):
             """Enhanced update with monitoring"""
             if self.game_state == "playing":
+                # Read the clock once per frame and share it
+                now_ms = pygame.time.get_ticks()
+                
                 # Record frame data
-                self.monitor.record_frame(self)
+                self.monitor.record_frame(self, now_ms)
                 
                 # Call original update
                 super().update()
                 
                 # Auto-optimization every 5 seconds
-                if self.auto_adjust and time.time() - self.last_optimization_time > 5:
+                if self.auto_adjust and now_ms - self.last_optimization_time > 5000:
                     self.auto_optimize()
-                    self.last_optimization_time = time.time()
+                    self.last_optimization_time = now_ms
         
         def check_object_collision(self):
             """Enhanced collision detection with monitoring"""
@@ -193,16 +390,15 @@ def create_enhanced_game_with_monitoring():
             collision_occurred = super().check_object_collision()
             
             if collision_occurred:
-                # Calculate impulse magnitude for analysis
+                # Squared separation as a simplified impulse measure (no sqrt needed)
                 dx = self.shield.x - self.sword.x
                 dy = self.shield.y - self.sword.y
-                distance = math.sqrt(dx*dx + dy*dy) if dx*dx + dy*dy > 0 else 1
                 
                 # Record collision
                 self.monitor.record_collision(self, "object", {
                     'sword_hp_before': sword_hp_before,
                     'shield_hp_before': shield_hp_before,
-                    'impulse': distance  # Simplified impulse measure
+                    'impulse_sq': dx*dx + dy*dy
                 })
             
             return collision_occurred
@@ -270,29 +466,35 @@ def create_enhanced_game_with_monitoring():
             if not self.debug_mode or self.game_state != "playing":
                 return
             
-            # Debug text
-            debug_font = pygame.font.Font(None, 18)
-            
             # Current velocities
-            sword_vel = math.sqrt(self.sword.vx**2 + self.sword.vy**2)
-            shield_vel = math.sqrt(self.shield.vx**2 + self.shield.vy**2)
+            sword_vel = math.hypot(self.sword.vx, self.sword.vy)
+            shield_vel = math.hypot(self.shield.vx, self.shield.vy)
             
             debug_info = [
                 f"Sword Vel: {sword_vel:.2f}",
                 f"Shield Vel: {shield_vel:.2f}",
                 f"Collisions: {self.monitor.collision_count}",
                 f"Boundary Hits: {self.monitor.boundary_hit_count}",
-                f"FPS: {self.monitor.analyze_stability()['fps']:.1f}"
+                f"FPS: {self.monitor.latest_analysis()['fps']:.1f}"
             ]
             
             for i, info in enumerate(debug_info):
-                text = debug_font.render(info, True, game.WHITE)
-                self.screen.blit(text, (10, 120 + i * 20))
+                self.screen.blit(self.render_debug_text(info), (10, 120 + i * 20))
             
             # Draw velocity vectors
             self.draw_velocity_vector(self.sword, game.RED)
             self.draw_velocity_vector(self.shield, game.BLUE)
         
+        def render_debug_text(self, info):
+            """Render a debug line, reusing the surface if the text is unchanged"""
+            text = self._text_cache.get(info)
+            if text is None:
+                text = self._debug_font.render(info, True, game.WHITE)
+                if len(self._text_cache) >= 64:
+                    del self._text_cache[next(iter(self._text_cache))]
+                self._text_cache[info] = text
+            return text
+        
         def draw_velocity_vector(self, obj, color):
             """Draw velocity vector for an object"""
             scale = 5  # Scale factor for visibility
@@ -332,11 +534,10 @@ def create_enhanced_game_with_monitoring():
                             self.auto_adjust = not self.auto_adjust
                             print(f"Auto-optimization: {'ON' if self.auto_adjust else 'OFF'}")
                     else:
-                        # Handle other events normally
-                        for event_check in [event]:
-                            if not self.handle_single_event(event_check):
-                                running = False
-                                break
+                        # Handle other events via the dispatch table
+                        handler = self._event_handlers.get(event.type)
+                        if handler and not handler(event):
+                            running = False
                 
                 self.update()
                 self.draw()
@@ -348,44 +549,43 @@ def create_enhanced_game_with_monitoring():
             
             pygame.quit()
         
-        def handle_single_event(self, event):
-            """Handle individual events (modified from original handle_events)"""
-            if event.type == pygame.QUIT:
-                return False
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    # Check if clicking on any slider
-                    if self.game_state == "playing":
-                        for key, slider in self.sliders.items():
-                            if slider['rect'].collidepoint(event.pos):
-                                self.dragging_slider = key
-                                self.update_slider(key, event.pos[0])
-                                break
-                        else:
-                            # Check button click if no slider was clicked
-                            button_rect = self.draw_ui()  # Get button rect
-                            if button_rect.collidepoint(event.pos):
-                                if self.game_state == "menu":
-                                    self.game_state = "playing"
-                                    self.reset_game()
-                                else:
-                                    self.game_state = "menu"
+        def _on_mouse_down(self, event):
+            """Handle mouse button presses (sliders and start/stop button)"""
+            if event.button == 1:  # Left click
+                # Check if clicking on any slider
+                if self.game_state == "playing":
+                    for key, slider in self.sliders.items():
+                        if slider['rect'].collidepoint(event.pos):
+                            self.dragging_slider = key
+                            self.update_slider(key, event.pos[0])
+                            break
                     else:
-                        # Menu state button check
+                        # Check button click if no slider was clicked
                         button_rect = self.draw_ui()  # Get button rect
                         if button_rect.collidepoint(event.pos):
-                            self.game_state = "playing"
-                            self.reset_game()
-            
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:  # Left click release
-                    self.dragging_slider = None
-            
-            elif event.type == pygame.MOUSEMOTION:
-                if self.dragging_slider and self.game_state == "playing":
-                    self.update_slider(self.dragging_slider, event.pos[0])
-            
+                            if self.game_state == "menu":
+                                self.game_state = "playing"
+                                self.reset_game()
+                            else:
+                                self.game_state = "menu"
+                else:
+                    # Menu state button check
+                    button_rect = self.draw_ui()  # Get button rect
+                    if button_rect.collidepoint(event.pos):
+                        self.game_state = "playing"
+                        self.reset_game()
+            return True
+        
+        def _on_mouse_up(self, event):
+            """Handle mouse button releases"""
+            if event.button == 1:  # Left click release
+                self.dragging_slider = None
+            return True
+        
+        def _on_mouse_motion(self, event):
+            """Handle mouse motion (slider dragging)"""
+            if self.dragging_slider and self.game_state == "playing":
+                self.update_slider(self.dragging_slider, event.pos[0])
             return True
     
     return MonitoredGame()
@@ -575,13 +575,17 @@ class ImprovedGame:
     
     def run(self):
         """Enhanced main loop"""
-        print("Enhanced Hexagon Physics Game")
-        print("Improvements:")
-        print("- Better collision physics")
-        print("- Velocity caps to prevent runaway speeds") 
-        print("- Enhanced visual effects")
-        print("- Improved slider controls")
-        print("- Performance monitoring")
+        # One write for the whole banner instead of a locked, flushed print per line
+        sys.stdout.write("\n".join([
+            "Enhanced Hexagon Physics Game",
+            "Improvements:",
+            "- Better collision physics",
+            "- Velocity caps to prevent runaway speeds",
+            "- Enhanced visual effects",
+            "- Improved slider controls",
+            "- Performance monitoring",
+        ]) + "\n")
+        sys.stdout.flush()
         
         running = True
         while running: